@@ -7,7 +7,6 @@ import logging
 import torch
 from pathlib import Path
 from dgl.data.utils import load_graphs
-from torch import FloatTensor
 from typing import Dict, Any, Union, Tuple
 
 logger = logging.getLogger(__name__)
@@ -36,13 +35,20 @@ def bounding_box_uvgrid(inp: torch.Tensor) -> torch.Tensor:
     try:
         # 提取坐标和可见性状态
         points = inp[..., :3].reshape((-1, 3))
-        visibility_mask = inp[..., 6].reshape(-1)
+        visibility_mask = inp[..., 6].reshape(-1).to(torch.bool)
 
-        # 只保留可见点
-        visible_points = points[visibility_mask == 1, :]
+        if not visibility_mask.any():
+            raise ValueError("点云不能为空")
+
+        # 掩码填充±inf后直接归约，不必物化可见点子集张量
+        pos_inf = torch.finfo(points.dtype).max
+        neg_inf = torch.finfo(points.dtype).min
+        mask_column = visibility_mask[:, None]
+        min_point = torch.where(mask_column, points, pos_inf).amin(dim=0)
+        max_point = torch.where(mask_column, points, neg_inf).amax(dim=0)
 
         # 计算边界框
-        return bounding_box_pointcloud(visible_points)
+        return torch.stack([min_point, max_point])
 
     except Exception as e:
         logger.error(f"计算UV网格边界框失败: {str(e)}")
@@ -72,13 +78,8 @@ def bounding_box_pointcloud(pts: torch.Tensor) -> torch.Tensor:
         raise ValueError("点云不能为空")
 
     try:
-        # 计算每个维度的最小值和最大值
-        x_coords = pts[:, 0]
-        y_coords = pts[:, 1]
-        z_coords = pts[:, 2]
-
-        min_point = torch.tensor([x_coords.min(), y_coords.min(), z_coords.min()])
-        max_point = torch.tensor([x_coords.max(), y_coords.max(), z_coords.max()])
+        # 单次融合归约同时得到每个维度的最小值和最大值，结果保留在pts所在设备上
+        min_point, max_point = torch.aminmax(pts, dim=0)
 
         return torch.stack([min_point, max_point])
 
@@ -86,9 +87,26 @@ def bounding_box_pointcloud(pts: torch.Tensor) -> torch.Tensor:
         logger.error(f"计算点云边界框失败: {str(e)}")
         raise Exception(f"计算点云边界框失败: {str(e)}")
 
+def _affine_inplace(t: torch.Tensor, center: torch.Tensor, scale: float) -> torch.Tensor:
+    """
+    对张量的坐标通道原地应用中心化和缩放变换
+
+    参数:
+        t: 输入张量，前3个通道为坐标
+        center: 中心点
+        scale: 缩放因子
+
+    返回:
+        torch.Tensor: 变换后的输入张量(原地修改)
+    """
+    # 节点和边特征共用同一变换，集中为单个融合的原地更新
+    t[..., :3].sub_(center).mul_(scale)
+    return t
+
 def center_and_scale_uvgrid(
     inp: torch.Tensor,
-    return_center_scale: bool = False
+    return_center_scale: bool = False,
+    inplace: bool = False
 ) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor, float]]:
     """
     对UV网格进行中心化和缩放
@@ -96,6 +114,7 @@ def center_and_scale_uvgrid(
     参数:
         inp: 输入张量，形状为(..., 7)
         return_center_scale: 是否返回中心和缩放因子
+        inplace: 是否直接在输入张量上变换(跳过clone拷贝)
 
     返回:
         如果return_center_scale为False，返回处理后的张量
@@ -123,10 +142,9 @@ def center_and_scale_uvgrid(
         # 计算中心点
         center_point = 0.5 * (bbox[0] + bbox[1])
 
-        # 中心化和缩放
-        inp_centered_scaled = inp.clone()
-        inp_centered_scaled[..., :3] -= center_point
-        inp_centered_scaled[..., :3] *= scale_factor
+        # 中心化和缩放(原地sub_/mul_融合，避免额外的内存遍历)
+        inp_centered_scaled = _affine_inplace(inp if inplace else inp.clone(),
+                                              center_point, scale_factor)
 
         if return_center_scale:
             return inp_centered_scaled, center_point, scale_factor
@@ -166,19 +184,21 @@ def load_one_graph(file_path: str) -> Dict[str, Any]:
 
         graph = graphs[0][0]
 
-        # 中心化和缩放
+        # 中心化和缩放(节点特征刚加载、后续直接覆盖，原地变换省去clone)
         graph.ndata["x"], center_point, scale_factor = center_and_scale_uvgrid(
             graph.ndata["x"],
-            return_center_scale=True
+            return_center_scale=True,
+            inplace=True
         )
 
-        # 对边数据进行相同的变换
-        graph.edata["x"][..., :3] -= center_point
-        graph.edata["x"][..., :3] *= scale_factor
+        # 对边数据进行相同的变换(与节点共用同一原地变换内核)
+        _affine_inplace(graph.edata["x"], center_point, scale_factor)
 
-        # 转换为FloatTensor
-        graph.ndata["x"] = graph.ndata["x"].type(FloatTensor)
-        graph.edata["x"] = graph.edata["x"].type(FloatTensor)
+        # 转换为float32(已是float32时跳过，避免整张量无谓拷贝)
+        if graph.ndata["x"].dtype != torch.float32:
+            graph.ndata["x"] = graph.ndata["x"].float()
+        if graph.edata["x"].dtype != torch.float32:
+            graph.edata["x"] = graph.edata["x"].float()
 
         return {
             "graph": graph,
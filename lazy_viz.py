@@ -0,0 +1,39 @@
+"""
+延迟导入模块
+按需加载重量级可视化依赖(matplotlib/vtk/open3d)
+
+这些库导入耗时可达数秒、常驻内存数十MB，只在真正用到
+可视化功能时才应加载，不应出现在启动关键路径上。
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 已加载模块的缓存，每个库只导入一次
+_cache = {}
+
+def get_vtk():
+    """首次调用时导入并缓存vtk模块"""
+    if 'vtk' not in _cache:
+        logger.debug("延迟加载vtk")
+        import vtk
+        _cache['vtk'] = vtk
+    return _cache['vtk']
+
+def get_open3d():
+    """首次调用时导入并缓存open3d模块"""
+    if 'open3d' not in _cache:
+        logger.debug("延迟加载open3d")
+        import open3d
+        _cache['open3d'] = open3d
+    return _cache['open3d']
+
+def init_matplotlib():
+    """首次调用时导入matplotlib并设置Qt5后端"""
+    if 'matplotlib' not in _cache:
+        logger.debug("延迟加载matplotlib")
+        import matplotlib
+        matplotlib.use('Qt5Agg')  # 设置matplotlib使用Qt5后端
+        _cache['matplotlib'] = matplotlib
+    return _cache['matplotlib']
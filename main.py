@@ -4,35 +4,10 @@
 
 import sys
 import logging
-import json  # 新增导入
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
 from ui_window import MainWindow
-# 在文件顶部添加：
-from system_tools import SystemMonitor, LogAnalyzer
-import os
-import sys
-import logging
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from ui_window import MainWindow
-from system_tools import SystemMonitor, LogAnalyzer
-from PyQt5.QtWidgets import (
-    QTabWidget, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit,
-    QPushButton, QWidget, QFileDialog, QMessageBox
-)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon
-# 确保导入必要的可视化库
-try:
-    import matplotlib
-    matplotlib.use('Qt5Agg')  # 设置matplotlib使用Qt5后端
-    import vtk
-    import open3d
-except ImportError as e:
-    print(f"可视化依赖库未安装: {str(e)}")
-    print("请安装以下库:")
-    print("pip install matplotlib vtk open3d")
+# 可视化库(matplotlib/vtk/open3d)不在启动时导入，
+# 由lazy_viz在首次用到可视化功能时按需加载
 
 def setup_logging():
     """
@@ -45,7 +20,8 @@ def setup_logging():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(sys.stdout),  # 输出到控制台
-            logging.FileHandler('application.log', encoding='utf-8')  # 输出到文件
+            # delay=True推迟open()到首条日志写入，不占用启动关键路径
+            logging.FileHandler('application.log', encoding='utf-8', delay=True)
         ]
     )
 
@@ -64,11 +40,14 @@ def main():
         app = QApplication(sys.argv)
         logger.info("应用程序启动")
 
-        # 设置全局字体和样式
-        app.setStyle('Fusion')
+        # 设置全局字体和样式(默认值已匹配时跳过，
+        # 避免无谓的StyleChange/FontChange事件遍历整个控件树)
+        if app.style().objectName().lower() != 'fusion':
+            app.setStyle('Fusion')
         font = app.font()
-        font.setPointSize(10)
-        app.setFont(font)
+        if font.pointSize() != 10:
+            font.setPointSize(10)
+            app.setFont(font)
         logger.debug("应用程序样式设置完成")
 
         # 创建并显示主窗口
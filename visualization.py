@@ -363,7 +363,7 @@ class VisualizationTab(QWidget):
         """选择模型文件"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择模型文件", "",
-            "STL文件 (*.stl);;点云文件 (*.txt)"
+            "STL文件 (*.stl);;点云文件 (*.npy *.txt)"
         )
         if file_path:
             self.model_file_edit.setText(file_path)
@@ -473,9 +473,12 @@ class VisualizationTab(QWidget):
                 # 显示STL模型
                 self.vtk_widget.load_stl(file_path)
 
-            elif file_path.lower().endswith('.txt'):
-                # 加载点云
-                points = np.loadtxt(file_path)
+            elif file_path.lower().endswith(('.npy', '.txt')):
+                # 加载点云(.npy为当前采样输出，.txt兼容历史数据)
+                if file_path.lower().endswith('.npy'):
+                    points = np.load(file_path)
+                else:
+                    points = np.loadtxt(file_path)
                 if points.shape[1] >= 3:
                     self.vtk_widget.load_point_cloud(points[:, :3])
                 else: